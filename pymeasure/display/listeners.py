@@ -23,6 +23,7 @@
 #
 
 import logging
+import pickle
 
 from .Qt import QtCore
 from .thread import StoppableQThread
@@ -71,8 +72,8 @@ class QListener(StoppableQThread):
         self.timeout = timeout
 
     def receive(self, flags=0):
-        topic, record = self.subscriber.recv_serialized(deserialize=cloudpickle.loads, flags=flags)
-        return topic, record
+        topic, record = self.subscriber.recv_multipart(flags=flags)
+        return topic.decode(), pickle.loads(record)
 
     def message_waiting(self):
         return self.poller.poll(self.timeout)
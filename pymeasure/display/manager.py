@@ -24,6 +24,8 @@
 
 import logging
 
+from collections import deque
+from functools import partial
 from os.path import basename
 
 from .Qt import QtCore
@@ -119,6 +121,10 @@ class Manager(QtCore.QObject):
     aborted. When instantiated, the Manager is linked to a :class:`.Browser`
     and a PyQtGraph `PlotItem` within the user interface, which are updated
     in accordance with the execution status of the Experiments.
+
+    :param worker_kwargs: Optional dictionary of keyword arguments for the
+        :class:`.Worker`, e.g. to bound its queues with
+        ``recorder_queue_size``, ``monitor_queue_size`` and ``monitor_policy``
     """
     _is_continuous = True
     _start_on_add = True
@@ -130,14 +136,22 @@ class Manager(QtCore.QObject):
     abort_returned = QtCore.QSignal(object)
     log = QtCore.QSignal(object)
 
-    def __init__(self, plot, browser, port=5888, log_level=logging.INFO, parent=None):
+    def __init__(self, plot, browser, port=5888, log_level=logging.INFO, parent=None,
+                 worker_kwargs=None):
         super().__init__(parent)
 
         self.experiments = ExperimentQueue()
         self._worker = None
         self._running_experiment = None
         self._monitor = None
+        self._pending = deque()
+        self._peeked = None
+        self._queueing_pending = False
         self.log_level = log_level
+        if worker_kwargs is None:
+            worker_kwargs = {}
+        self.worker_kwargs = worker_kwargs
+        self.last_queue_statistics = None
 
         self.plot = plot
         self.browser = browser
@@ -175,13 +189,66 @@ class Manager(QtCore.QObject):
         self.experiments.append(experiment)
 
     def queue(self, experiment):
-        """ Adds an experiment to the queue.
+        """ Adds an experiment to the queue. If experiments that were added
+        with :meth:`.queue_lazily` are still waiting, the experiment is added
+        after them, to keep the order in which experiments were queued.
         """
+        if not self._queueing_pending and self._peek_pending() is not None:
+            self._pending.append(iter((partial(self.queue, experiment),)))
+            return
         self.load(experiment)
         self.queued.emit(experiment)
+        if self._start_on_add and not self.is_running() and not self._queueing_pending:
+            self.next()
+
+    def queue_lazily(self, queuers, length=None):
+        """ Adds a series of experiments to the queue, without creating
+        them up front. Each element of the iterable is a callable that takes
+        no arguments and queues a single experiment by calling :meth:`.queue`.
+        The next callable is only called once all previously queued
+        experiments have been started, so that a long sequence does not
+        create all its procedures, results and curves at once. Experiments
+        added with :meth:`.queue` in the meantime run after the lazily added
+        ones.
+
+        :param queuers: Iterable of callables that queue one experiment each
+        :param length: Optional total number of experiments, used for logging
+        """
+        if length is not None:
+            log.debug("Manager received %d experiments to queue lazily", length)
+        self._pending.append(iter(queuers))
         if self._start_on_add and not self.is_running():
             self.next()
 
+    def has_next(self):
+        """ Returns True if another experiment is queued or waiting to
+        be queued
+        """
+        return self.experiments.has_next() or self._peek_pending() is not None
+
+    def _peek_pending(self):
+        """ Returns the callable that queues the next lazily added
+        experiment, without calling it, or None if there is none
+        """
+        while self._peeked is None and self._pending:
+            try:
+                self._peeked = next(self._pending[0])
+            except StopIteration:
+                self._pending.popleft()
+        return self._peeked
+
+    def _queue_pending(self):
+        """ Queues the next lazily added experiment, as long as no other
+        experiment is waiting in the queue
+        """
+        self._queueing_pending = True
+        try:
+            while not self.experiments.has_next() and self._peek_pending() is not None:
+                queuer, self._peeked = self._peeked, None
+                queuer()
+        finally:
+            self._queueing_pending = False
+
     def remove(self, experiment):
         """ Removes an Experiment
         """
@@ -191,8 +258,11 @@ class Manager(QtCore.QObject):
         self.plot.removeItem(experiment.curve)
 
     def clear(self):
-        """ Remove all Experiments
+        """ Remove all Experiments, including those that are waiting to
+        be queued
         """
+        self._pending.clear()
+        self._peeked = None
         for experiment in self.experiments[:]:
             self.remove(experiment)
 
@@ -204,12 +274,14 @@ class Manager(QtCore.QObject):
         if self.is_running():
             raise Exception("Another procedure is already running")
         else:
+            self._queue_pending()
             if self.experiments.has_next():
                 log.debug("Manager is initiating the next experiment")
                 experiment = self.experiments.next()
                 self._running_experiment = experiment
 
-                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level)
+                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level,
+                                      **self.worker_kwargs)
 
                 self._monitor = Monitor(self._worker.monitor_queue)
                 self._monitor.worker_running.connect(self._running)
@@ -227,8 +299,21 @@ class Manager(QtCore.QObject):
         if self.is_running():
             self.running.emit(self._running_experiment)
 
+    def queue_statistics(self):
+        """ Returns the queue counters of the running Worker, or of the last
+        Worker if no experiment is running, see :meth:`.Worker.queue_statistics`
+        """
+        if self._worker is not None:
+            return self._worker.queue_statistics()
+        return self.last_queue_statistics
+
     def _clean_up(self):
         self._worker.join()
+        self.last_queue_statistics = self._worker.queue_statistics()
+        for name, statistics in self.last_queue_statistics.items():
+            if statistics['blocked'] or statistics['dropped']:
+                log.warning("The %s queue of the Worker could not keep up with the "
+                            "Procedure: %r", name, statistics)
         del self._worker
         del self._monitor
         self._worker = None
@@ -325,8 +410,10 @@ class ImageManager(Manager):
     abort_returned = QtCore.QSignal(object)
     log = QtCore.QSignal(object)
 
-    def __init__(self, plot, im_plot, browser, port=5888, log_level=logging.INFO, parent=None):
-        super().__init__(plot, browser, port=5888, log_level=logging.INFO, parent=None)
+    def __init__(self, plot, im_plot, browser, port=5888, log_level=logging.INFO, parent=None,
+                 worker_kwargs=None):
+        super().__init__(plot, browser, port=5888, log_level=logging.INFO, parent=None,
+                         worker_kwargs=worker_kwargs)
         # overrides necessary variables to make image features work
         self.experiments = ImageExperimentQueue()
 
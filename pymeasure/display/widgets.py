@@ -30,7 +30,6 @@ import pyqtgraph as pg
 from functools import partial
 import numpy
 from collections import ChainMap
-from itertools import product
 
 from .browser import Browser
 from .curves import ResultsCurve, Crosshairs, ResultsImage
@@ -814,32 +813,55 @@ class SequencerWidget(QtGui.QWidget):
 
     def queue_sequence(self):
         """
-        Obtain a list of parameters from the sequence tree, enter these into
-        procedures, and queue these procedures.
+        Obtain the parameters from the sequence tree and hand them to the
+        manager, which turns them into procedures and queues these
+        procedures one at a time, as soon as the previous one is started.
         """
 
         self.queue_button.setEnabled(False)
 
         try:
-            sequence = self._generate_sequence_from_tree()
+            length, sequence = self._generate_sequence_from_tree()
         except SequenceEvaluationException:
             log.error("Evaluation of one of the sequence strings went wrong, no sequence queued.")
         else:
             log.info(
-                "Queuing %d measurements based on the entered sequences." % len(sequence)
+                "Queuing %d measurements based on the entered sequences." % length
             )
 
-            for entry in sequence:
-                QtGui.QApplication.processEvents()
-                parameters = dict(ChainMap(*entry[::-1]))
-
-                procedure = self._parent.make_procedure()
-                procedure.set_parameters(parameters)
-                self._parent.queue(procedure=procedure)
+            # Capture the other inputs now, so that editing them while the
+            # sequence runs does not affect the remaining measurements
+            base_parameters = {
+                name: value for name, value
+                in self._parent.make_procedure().parameter_values().items()
+                if value is not None
+            }
+
+            self._parent.manager.queue_lazily(
+                (partial(self._queue_entry, base_parameters, entry)
+                 for entry in sequence),
+                length
+            )
 
         finally:
             self.queue_button.setEnabled(True)
 
+    def _queue_entry(self, base_parameters, entry):
+        """
+        Make a procedure for a single entry of the sequence and queue it.
+
+        :param base_parameters: Dictionary of the parameter values at the
+            time the sequence was queued.
+        :param entry: A tuple of single-parameter dictionaries, ordered from
+            the outer to the inner level of the sequence tree.
+        """
+
+        parameters = dict(ChainMap(*entry[::-1], base_parameters))
+
+        procedure = self._parent.make_procedure()
+        procedure.set_parameters(parameters)
+        self._parent.queue(procedure=procedure)
+
     def load_sequence(self, *, fileName=None):
         """
         Load a sequence from a .txt file.
@@ -882,13 +904,23 @@ class SequencerWidget(QtGui.QWidget):
 
     def _generate_sequence_from_tree(self):
         """
-        Generate a list of parameters from the sequence tree.
+        Generate the sequence of parameters from the sequence tree. The
+        sequence is not expanded up front; instead, the number of entries is
+        returned together with a generator that yields the entries one by one.
+        Every entry is a tuple of single-parameter dictionaries.
+        """
+
+        nodes = self._nodes_from_tree()
+        return self._count_sequence(nodes), self._expand_sequence(nodes)
+
+    def _nodes_from_tree(self):
+        """
+        Evaluate the sequence strings in the sequence tree and return a
+        nested list of (parameter, values, children) tuples, one per item.
         """
 
         iterator = QtGui.QTreeWidgetItemIterator(self.tree)
-        sequences = []
-        current_sequence = [[] for i in range(self.MAXDEPTH)]
-        temp_sequence = [[] for i in range(self.MAXDEPTH)]
+        nodes = [[] for i in range(self.MAXDEPTH + 1)]
 
         while iterator.value():
             item = iterator.value()
@@ -901,56 +933,50 @@ class SequencerWidget(QtGui.QWidget):
                 name, depth,
             )
 
-            try:
-                sequence_entry = [{parameter: value} for value in values]
-            except TypeError:
+            if values.ndim == 0:
                 log.error(
                     "TypeError, likely no sequence for one of the parameters"
                 )
-            else:
-                current_sequence[depth].extend(sequence_entry)
+                values = numpy.empty(0)
+
+            children = []
+            nodes[depth].append((parameter, values, children))
+            nodes[depth + 1] = children
 
             iterator += 1
-            next_depth = self._depth_of_child(iterator.value())
-
-            for depth_idx in range(depth, next_depth, -1):
-                temp_sequence[depth_idx].extend(current_sequence[depth_idx])
-
-                if depth_idx != 0:
-                    sequence_products = list(product(
-                        current_sequence[depth_idx - 1],
-                        temp_sequence[depth_idx]
-                    ))
-
-                    for i in range(len(sequence_products)):
-                        try:
-                            element = sequence_products[i][1]
-                        except IndexError:
-                            log.error(
-                                "IndexError, likely empty nested parameter"
-                            )
-                        else:
-                            if isinstance(element, tuple):
-                                sequence_products[i] = (
-                                    sequence_products[i][0], *element)
-
-                    temp_sequence[depth_idx - 1].extend(sequence_products)
-                    temp_sequence[depth_idx] = []
-
-                current_sequence[depth_idx] = []
-                current_sequence[depth_idx - 1] = []
-
-            if depth == next_depth:
-                temp_sequence[depth].extend(current_sequence[depth])
-                current_sequence[depth] = []
-
-        sequences = temp_sequence[0]
-
-        for idx in range(len(sequences)):
-            if not isinstance(sequences[idx], tuple):
-                sequences[idx] = (sequences[idx],)
-
-        return sequences
+
+        return nodes[0]
+
+    @classmethod
+    def _count_sequence(cls, nodes):
+        """
+        Count the number of entries in the sequence described by the nodes,
+        without expanding it.
+        """
+
+        count = 0
+        for parameter, values, children in nodes:
+            if children:
+                count += len(values) * cls._count_sequence(children)
+            else:
+                count += len(values)
+        return count
+
+    @classmethod
+    def _expand_sequence(cls, nodes):
+        """
+        Lazily expand the sequence described by the nodes; the values of
+        every node are combined with all entries of its children, and
+        siblings follow each other.
+        """
+
+        for parameter, values, children in nodes:
+            for value in values:
+                if children:
+                    for entry in cls._expand_sequence(children):
+                        yield ({parameter: value}, *entry)
+                else:
+                    yield ({parameter: value},)
 
     @staticmethod
     def _depth_of_child(item):
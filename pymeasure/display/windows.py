@@ -131,7 +131,9 @@ class ManagedWindow(QtGui.QMainWindow):
 
     The ManagedWindow uses a Manager to control Workers in a Queue,
     and provides a simple interface. The :meth:`~.queue` method must be
-    overridden by the child class.
+    overridden by the child class. The ``worker_kwargs`` dictionary is passed
+    on to each :class:`~pymeasure.experiment.workers.Worker`, e.g. to bound
+    its queues.
 
     .. seealso::
 
@@ -152,7 +154,8 @@ class ManagedWindow(QtGui.QMainWindow):
 
     def __init__(self, procedure_class, inputs=(), displays=(), x_axis=None, y_axis=None,
                  log_channel='', log_level=logging.INFO, parent=None, sequencer=False,
-                 sequencer_inputs=None, sequence_file=None, inputs_in_scrollarea=False):
+                 sequencer_inputs=None, sequence_file=None, inputs_in_scrollarea=False,
+                 worker_kwargs=None):
         super().__init__(parent)
         app = QtCore.QCoreApplication.instance()
         app.aboutToQuit.connect(self.quit)
@@ -163,6 +166,7 @@ class ManagedWindow(QtGui.QMainWindow):
         self.sequencer_inputs = sequencer_inputs
         self.sequence_file = sequence_file
         self.inputs_in_scrollarea = inputs_in_scrollarea
+        self.worker_kwargs = worker_kwargs
         self.log = logging.getLogger(log_channel)
         self.log_level = log_level
         log.setLevel(log_level)
@@ -209,7 +213,8 @@ class ManagedWindow(QtGui.QMainWindow):
             parent=self
         )
 
-        self.manager = Manager(self.plot, self.browser, log_level=self.log_level, parent=self)
+        self.manager = Manager(self.plot, self.browser, log_level=self.log_level, parent=self,
+                               worker_kwargs=self.worker_kwargs)
         self.manager.abort_returned.connect(self.abort_returned)
         self.manager.queued.connect(self.queued)
         self.manager.running.connect(self.running)
@@ -479,7 +484,7 @@ class ManagedWindow(QtGui.QMainWindow):
         self.abort_button.setText("Abort")
         self.abort_button.clicked.disconnect()
         self.abort_button.clicked.connect(self.abort)
-        if self.manager.experiments.has_next():
+        if self.manager.has_next():
             self.manager.resume()
         else:
             self.abort_button.setEnabled(False)
@@ -494,14 +499,14 @@ class ManagedWindow(QtGui.QMainWindow):
         self.browser_widget.clear_button.setEnabled(False)
 
     def abort_returned(self, experiment):
-        if self.manager.experiments.has_next():
+        if self.manager.has_next():
             self.abort_button.setText("Resume")
             self.abort_button.setEnabled(True)
         else:
             self.browser_widget.clear_button.setEnabled(True)
 
     def finished(self, experiment):
-        if not self.manager.experiments.has_next():
+        if not self.manager.has_next():
             self.abort_button.setEnabled(False)
             self.browser_widget.clear_button.setEnabled(True)
 
@@ -518,7 +523,9 @@ class ManagedImageWindow(QtGui.QMainWindow):
 
     The MangedImageWindow uses a Manager to control Workers in a Queue,
     and provides a simple interface. The :meth:`~.queue` method must be
-    overridden by the child class.
+    overridden by the child class. The ``worker_kwargs`` dictionary is passed
+    on to each :class:`~pymeasure.experiment.workers.Worker`, e.g. to bound
+    its queues.
 
     .. seealso::
 
@@ -539,13 +546,14 @@ class ManagedImageWindow(QtGui.QMainWindow):
     EDITOR = 'gedit'
 
     def __init__(self, procedure_class, x_axis, y_axis, z_axis=None, inputs=(), displays=(),
-                 log_channel='', log_level=logging.INFO, parent=None):
+                 log_channel='', log_level=logging.INFO, parent=None, worker_kwargs=None):
         super().__init__(parent)
         app = QtCore.QCoreApplication.instance()
         app.aboutToQuit.connect(self.quit)
         self.procedure_class = procedure_class
         self.inputs = inputs
         self.displays = displays
+        self.worker_kwargs = worker_kwargs
         self.log = logging.getLogger(log_channel)
         self.log_level = log_level
         log.setLevel(log_level)
@@ -595,7 +603,8 @@ class ManagedImageWindow(QtGui.QMainWindow):
             parent=self
         )
 
-        self.manager = ImageManager(self.plot, self.im_plot, self.browser, log_level=self.log_level, parent=self)
+        self.manager = ImageManager(self.plot, self.im_plot, self.browser, log_level=self.log_level,
+                                    parent=self, worker_kwargs=self.worker_kwargs)
         self.manager.abort_returned.connect(self.abort_returned)
         self.manager.queued.connect(self.queued)
         self.manager.running.connect(self.running)
@@ -867,7 +876,7 @@ class ManagedImageWindow(QtGui.QMainWindow):
         self.abort_button.setText("Abort")
         self.abort_button.clicked.disconnect()
         self.abort_button.clicked.connect(self.abort)
-        if self.manager.experiments.has_next():
+        if self.manager.has_next():
             self.manager.resume()
         else:
             self.abort_button.setEnabled(False)
@@ -882,13 +891,13 @@ class ManagedImageWindow(QtGui.QMainWindow):
         self.browser_widget.clear_button.setEnabled(False)
 
     def abort_returned(self, experiment):
-        if self.manager.experiments.has_next():
+        if self.manager.has_next():
             self.abort_button.setText("Resume")
             self.abort_button.setEnabled(True)
         else:
             self.browser_widget.clear_button.setEnabled(True)
 
     def finished(self, experiment):
-        if not self.manager.experiments.has_next():
+        if not self.manager.has_next():
             self.abort_button.setEnabled(False)
             self.browser_widget.clear_button.setEnabled(True)
@@ -38,6 +38,7 @@ from pymeasure.log import setup_logging, console_log
 from pymeasure.experiment import Results, Worker
 from .parameters import Measurable
 import time, signal
+from queue import Full
 import numpy as np
 import tempfile
 import gc
@@ -258,6 +259,9 @@ class Experiment(object):
     def __del__(self):
         self.scribe.stop()
         if self.worker.is_alive():
-            self.worker.recorder_queue.put(None)
-            self.worker.monitor_queue.put(None)
+            for queue in (self.worker.recorder_queue, self.worker.monitor_queue):
+                try:
+                    queue.put_nowait(None)
+                except Full:
+                    log.warning("Could not send the stop signal to a full Worker queue")
             self.worker.stop()
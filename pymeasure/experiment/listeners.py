@@ -23,6 +23,7 @@
 #
 
 import logging
+import pickle
 from logging import StreamHandler, FileHandler
 
 from ..log import QueueListener
@@ -78,8 +79,8 @@ class Listener(StoppableThread):
         self.timeout = timeout
 
     def receive(self, flags=0):
-        topic, record = self.subscriber.recv_serialized(deserialize=cloudpickle.loads, flags=flags)
-        return topic, record
+        topic, record = self.subscriber.recv_multipart(flags=flags)
+        return topic.decode(), pickle.loads(record)
 
     def message_waiting(self):
         return self.poller.poll(self.timeout)
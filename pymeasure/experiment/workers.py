@@ -24,11 +24,12 @@
 
 import sys
 import logging
+import pickle
 import time
 import traceback
 from logging.handlers import QueueHandler
 from importlib.machinery import SourceFileLoader
-from queue import Queue
+from queue import Queue, Full
 
 from .listeners import Recorder
 from .procedure import Procedure, ProcedureWrapper
@@ -48,15 +49,151 @@ except ImportError:
     log.warning("ZMQ and cloudpickle are required for TCP communication")
 
 
+class WorkerQueue(Queue):
+    """ Queue of messages between the Worker and its consumers, with an
+    optional maximum size and a policy that determines what happens when
+    the queue is full.
+
+    * ``'block'``: The producer waits until the consumer has made room,
+      which applies backpressure to the :class:`.Procedure`.
+    * ``'drop'``: The oldest waiting message of a droppable topic is
+      discarded to make room for the new message.
+    * ``'coalesce'``: A new message of a droppable topic replaces a
+      message of the same topic at the end of the queue, so that only the
+      latest value is kept. When the queue is full, this falls back to
+      the ``'drop'`` policy.
+
+    Only data messages are bounded: results records and ``(topic, record)``
+    messages of a droppable topic. Messages of other topics (e.g. status
+    changes) and the ``None`` stop sentinel are rare and must not be lost,
+    so they are always added, if necessary beyond the maximum size. This
+    ensures that stopping a Worker never blocks, even if nobody reads the
+    queue. The counters :attr:`put_count`, :attr:`dropped_count`,
+    :attr:`coalesced_count`, :attr:`blocked_count`, :attr:`overflow_count`
+    and :attr:`max_qsize` keep track of the throughput of the queue.
+
+    :param maxsize: Maximum number of data messages, 0 for an unbounded queue
+    :param policy: One of ``'block'``, ``'drop'`` or ``'coalesce'``
+    :param droppable: Topics of messages that may be dropped or coalesced
+    """
+
+    POLICIES = ('block', 'drop', 'coalesce')
+
+    def __init__(self, maxsize=0, policy='block', droppable=('progress',)):
+        if policy not in self.POLICIES:
+            raise ValueError("Invalid WorkerQueue policy %r, expected one of %r" % (
+                policy, self.POLICIES))
+        super().__init__(maxsize)
+        self.policy = policy
+        self.droppable = tuple(droppable)
+        self.put_count = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+        self.blocked_count = 0
+        self.overflow_count = 0
+        self.max_qsize = 0
+
+    def _is_droppable(self, item):
+        return isinstance(item, tuple) and len(item) == 2 and item[0] in self.droppable
+
+    def _is_control(self, item):
+        return item is None or (isinstance(item, tuple) and not self._is_droppable(item))
+
+    def _drop_oldest(self):
+        for index, item in enumerate(self.queue):
+            if self._is_droppable(item):
+                del self.queue[index]
+                self.dropped_count += 1
+                self.unfinished_tasks -= 1
+                if self.unfinished_tasks == 0:
+                    self.all_tasks_done.notify_all()
+                return True
+        return False
+
+    def _wait_for_room(self, block, timeout):
+        self.blocked_count += 1
+        if not block:
+            raise Full
+        elif timeout is None:
+            while self._qsize() >= self.maxsize:
+                self.not_full.wait()
+        elif timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        else:
+            endtime = time.monotonic() + timeout
+            while self._qsize() >= self.maxsize:
+                remaining = endtime - time.monotonic()
+                if remaining <= 0.0:
+                    raise Full
+                self.not_full.wait(remaining)
+
+    def put(self, item, block=True, timeout=None):
+        """ Puts a message on the queue, applying the policy of the queue
+        if it is full. Raises :class:`queue.Full` only if a data message
+        with the ``'block'`` policy can not be placed before the timeout.
+        """
+        with self.not_full:
+            self.put_count += 1
+            droppable = self._is_droppable(item)
+
+            if (self.policy == 'coalesce' and droppable and self.queue and
+                    self._is_droppable(self.queue[-1]) and self.queue[-1][0] == item[0]):
+                self.queue[-1] = item
+                self.coalesced_count += 1
+                return
+
+            if 0 < self.maxsize <= self._qsize():
+                if self.policy != 'block' and self._drop_oldest():
+                    pass
+                elif self._is_control(item):
+                    self.overflow_count += 1
+                elif self.policy != 'block':
+                    self.dropped_count += 1
+                    return
+                else:
+                    self._wait_for_room(block, timeout)
+
+            self._put(item)
+            self.max_qsize = max(self.max_qsize, self._qsize())
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def statistics(self):
+        """ Returns a dictionary with the counters of the queue """
+        with self.mutex:
+            return {
+                'put': self.put_count,
+                'dropped': self.dropped_count,
+                'coalesced': self.coalesced_count,
+                'blocked': self.blocked_count,
+                'overflow': self.overflow_count,
+                'max_qsize': self.max_qsize,
+            }
+
+
 class Worker(StoppableThread):
     """ Worker runs the procedure and emits information about
     the procedure and its status over a ZMQ TCP port. In a child
     thread, a Recorder is run to write the results to
     """
 
-    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
+    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None,
+                 recorder_queue_size=0, monitor_queue_size=0, monitor_policy='drop',
+                 progress_interval=0.1):
         """ Constructs a Worker to perform the Procedure
         defined in the file at the filepath
+
+        :param recorder_queue_size: Maximum number of results waiting to be
+            written, 0 for no limit. When the limit is reached, the Procedure
+            blocks until the Recorder has caught up, so no data is lost.
+        :param monitor_queue_size: Maximum number of status and progress
+            messages waiting for the monitor, 0 for no limit
+        :param monitor_policy: Policy of the monitor queue when it is full,
+            see :class:`.WorkerQueue`
+        :param progress_interval: Minimum time in seconds between two progress
+            messages. Progress emitted in between is coalesced, so that only
+            the latest value is sent once the interval has passed or before
+            the next status message. Set to 0 to send every progress message.
         """
         super().__init__()
 
@@ -68,16 +205,22 @@ class Worker(StoppableThread):
         self.results.procedure.status = Procedure.QUEUED
 
         self.recorder = None
-        self.recorder_queue = Queue()
+        self.recorder_queue = WorkerQueue(recorder_queue_size, policy='block')
 
-        self.monitor_queue = Queue()
+        self.monitor_queue = WorkerQueue(monitor_queue_size, policy=monitor_policy)
         if log_queue is None:
             log_queue = Queue()
         self.log_queue = log_queue
         self.log_level = log_level
 
+        self.progress_interval = progress_interval
+        self._last_progress_time = None
+        self._pending_progress = None
+
         self.context = None
         self.publisher = None
+        self._subscriptions = set()
+        self._log_messages = False
 
     def join(self, timeout=0):
         try:
@@ -88,18 +231,61 @@ class Worker(StoppableThread):
             super().join(0)
 
     def emit(self, topic, record):
-        """ Emits data of some topic over TCP """
-        log.debug("Emitting message: %s %s", topic, record)
+        """ Emits data of some topic over TCP and to the recorder and
+        monitor queues. Progress messages are rate limited according to
+        :attr:`progress_interval`; status messages are always sent, after
+        any progress that was held back.
+        """
+        if topic == 'progress' and self.progress_interval:
+            now = time.monotonic()
+            if (self._last_progress_time is not None and
+                    now - self._last_progress_time < self.progress_interval):
+                self._pending_progress = record
+                return
+            self._last_progress_time = now
+            self._pending_progress = None
+        elif topic == 'status':
+            self.flush_progress()
+        self._emit_now(topic, record)
 
-        try:
-            self.publisher.send_serialized((topic, record), serialize=cloudpickle.dumps)
-        except (NameError, AttributeError):
-            pass  # No dumps defined
+    def _emit_now(self, topic, record):
+        if self._log_messages:
+            log.debug("Emitting message: %s %s", topic, record)
+
+        if self.publisher is not None and self.has_subscribers(topic):
+            self.publish(topic, record)
         if topic == 'results':
-            self.recorder.handle(record)
+            self.recorder_queue.put(record)
         elif topic == 'status' or topic == 'progress':
             self.monitor_queue.put((topic, record))
 
+    def has_subscribers(self, topic):
+        """ Returns True if a subscriber listens to the topic, based on the
+        subscription messages received by the XPUB publisher socket
+        """
+        while self.publisher.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+            message = self.publisher.recv()
+            if message[:1] == b'\x01':
+                self._subscriptions.add(message[1:])
+            elif message[:1] == b'\x00':
+                self._subscriptions.discard(message[1:])
+        encoded = topic.encode()
+        return any(encoded.startswith(prefix) for prefix in self._subscriptions)
+
+    def publish(self, topic, record):
+        """ Sends a message over TCP as a topic frame and a pickled record,
+        so that subscribers can filter on the topic
+        """
+        self.publisher.send_multipart(
+            (topic.encode(), pickle.dumps(record, pickle.HIGHEST_PROTOCOL)))
+
+    def flush_progress(self):
+        """ Emits the latest progress that was held back by the rate limit """
+        if self._pending_progress is not None:
+            record, self._pending_progress = self._pending_progress, None
+            self._last_progress_time = time.monotonic()
+            self._emit_now('progress', record)
+
     def handle_abort(self):
         log.exception("User stopped Worker execution prematurely")
         self.update_status(Procedure.ABORTED)
@@ -114,16 +300,31 @@ class Worker(StoppableThread):
         self.procedure.status = status
         self.emit('status', status)
 
+    def queue_statistics(self):
+        """ Returns the counters of the recorder and monitor queues, which
+        show whether the consumers keep up with the Procedure
+        """
+        return {
+            'recorder': self.recorder_queue.statistics(),
+            'monitor': self.monitor_queue.statistics(),
+        }
+
     def shutdown(self):
         self.procedure.shutdown()
 
+        # Write all results before reporting the final status
+        self.recorder.stop()
+
         if self.should_stop() and self.procedure.status == Procedure.RUNNING:
             self.update_status(Procedure.ABORTED)
         elif self.procedure.status == Procedure.RUNNING:
             self.update_status(Procedure.FINISHED)
             self.emit('progress', 100.)
+        self.flush_progress()
 
-        self.recorder.stop()
+        statistics = self.queue_statistics()
+        if statistics['recorder']['blocked'] or statistics['monitor']['dropped']:
+            log.info("Worker queues could not keep up with the Procedure: %r", statistics)
         self.monitor_queue.put(None)
 
     def run(self):
@@ -134,6 +335,7 @@ class Worker(StoppableThread):
         # log.addHandler(TopicQueueHandler(self.monitor_queue))
         # log.addHandler(QueueHandler(self.log_queue))
         log.info("Worker thread started")
+        self._log_messages = log.isEnabledFor(logging.DEBUG)
 
         self.procedure = self.results.procedure
 
@@ -150,12 +352,13 @@ class Worker(StoppableThread):
             try:
                 self.context = zmq.Context()
                 log.debug("Worker ZMQ Context: %r" % self.context)
-                self.publisher = self.context.socket(zmq.PUB)
+                self.publisher = self.context.socket(zmq.XPUB)
                 self.publisher.bind('tcp://*:%d' % self.port)
                 log.info("Worker connected to tcp://*:%d" % self.port)
                 time.sleep(0.01)
             except Exception:
                 log.exception("couldn't connect to ZMQ context")
+                self.publisher = None
 
         log.info("Worker started running an instance of %r", self.procedure.__class__.__name__)
         self.update_status(Procedure.RUNNING)
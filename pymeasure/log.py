@@ -33,6 +33,11 @@ log.addHandler(logging.NullHandler())
 
 
 class QueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # The listener thread makes room in bounded queues, so wait for it
+        # instead of raising queue.Full
+        self.queue.put(self._sentinel)
+
     def is_alive(self):
         try:
             return self._thread.is_alive()
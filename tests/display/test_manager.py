@@ -0,0 +1,114 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import pytest
+from unittest import mock
+
+from pymeasure.display.manager import Manager
+from pymeasure.experiment.procedure import Procedure
+
+
+def make_experiment():
+    experiment = mock.MagicMock()
+    experiment.procedure.status = Procedure.QUEUED
+    return experiment
+
+
+def mark_running(manager):
+    manager.running_experiment().procedure.status = Procedure.RUNNING
+
+
+@pytest.fixture
+def manager(qtbot):
+    with mock.patch('pymeasure.display.manager.Worker'), \
+            mock.patch('pymeasure.display.manager.Monitor'):
+        yield Manager(mock.MagicMock(), mock.MagicMock())
+
+
+def finish_running(manager):
+    manager.running_experiment().procedure.status = Procedure.FINISHED
+    manager._finish()
+
+
+class TestManagerQueueLazily:
+    def test_experiments_are_made_when_needed(self, manager):
+        experiments = [make_experiment() for i in range(3)]
+        made = []
+
+        def queuer(experiment):
+            made.append(experiment)
+            manager.queue(experiment)
+
+        manager.queue_lazily((lambda e=e: queuer(e) for e in experiments), 3)
+        assert made == experiments[:1]
+        assert manager.running_experiment() is experiments[0]
+        assert manager.has_next()
+
+        finish_running(manager)
+        assert made == experiments[:2]
+        assert manager.running_experiment() is experiments[1]
+
+        finish_running(manager)
+        assert manager.running_experiment() is experiments[2]
+        mark_running(manager)
+        assert not manager.has_next()
+
+        finish_running(manager)
+        assert not manager.is_running()
+
+    def test_queue_keeps_order_after_lazy_experiments(self, manager):
+        lazy = make_experiment()
+        extra = make_experiment()
+        manager.queue(make_experiment())  # starts running directly
+        manager.queue_lazily(iter([lambda: manager.queue(lazy)]))
+        manager.queue(extra)
+        assert extra not in manager.experiments
+
+        finish_running(manager)
+        assert manager.running_experiment() is lazy
+        finish_running(manager)
+        assert manager.running_experiment() is extra
+
+    def test_clear_drops_pending(self, manager):
+        queuer = mock.MagicMock()
+        manager._start_on_add = False
+        manager.queue_lazily(iter([queuer, queuer]))
+        assert manager.has_next()
+        manager.clear()
+        assert not manager.has_next()
+        queuer.assert_not_called()
+
+
+def test_worker_kwargs_are_passed_on(qtbot):
+    with mock.patch('pymeasure.display.manager.Worker') as MockWorker, \
+            mock.patch('pymeasure.display.manager.Monitor'):
+        manager = Manager(mock.MagicMock(), mock.MagicMock(),
+                          worker_kwargs={'monitor_queue_size': 10})
+        experiment = make_experiment()
+        manager.queue(experiment)
+        MockWorker.assert_called_once_with(experiment.results, port=manager.port,
+                                           log_level=manager.log_level,
+                                           monitor_queue_size=10)
+        assert manager.queue_statistics() is MockWorker.return_value.queue_statistics()
@@ -0,0 +1,95 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2020 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import numpy as np
+import pytest
+
+from pymeasure.display.Qt import QtGui
+from pymeasure.display.widgets import SequencerWidget
+from pymeasure.experiment import Procedure, FloatParameter
+
+
+def nested_nodes():
+    inner = [('z', np.array([5, 6]), [])]
+    return [
+        ('x', np.array([1, 2]), [('y', np.array([3]), inner), ('w', np.array([4]), [])]),
+        ('v', np.array([7]), []),
+    ]
+
+
+class TestSequencerWidget:
+    def test_count_sequence(self):
+        assert SequencerWidget._count_sequence(nested_nodes()) == 7
+
+    def test_expand_sequence_is_lazy(self):
+        sequence = SequencerWidget._expand_sequence(nested_nodes())
+        assert next(sequence) == ({'x': 1}, {'y': 3}, {'z': 5})
+
+    def test_expand_sequence(self):
+        sequence = list(SequencerWidget._expand_sequence(nested_nodes()))
+        assert sequence == [
+            ({'x': 1}, {'y': 3}, {'z': 5}),
+            ({'x': 1}, {'y': 3}, {'z': 6}),
+            ({'x': 1}, {'w': 4}),
+            ({'x': 2}, {'y': 3}, {'z': 5}),
+            ({'x': 2}, {'y': 3}, {'z': 6}),
+            ({'x': 2}, {'w': 4}),
+            ({'v': 7},),
+        ]
+
+
+class TestSequencerWidgetTree:
+    @pytest.fixture
+    def sequencer(self, qtbot):
+        class TestProcedure(Procedure):
+            a = FloatParameter('A')
+            b = FloatParameter('B')
+
+        parent = QtGui.QWidget()
+        parent.procedure_class = TestProcedure
+        parent.displays = ['a', 'b']
+        qtbot.addWidget(parent)
+        return SequencerWidget(parent=parent)
+
+    def test_generate_sequence_from_tree(self, sequencer):
+        sequencer._add_tree_item(level=0, parameter='A', sequence='[1, 2]')
+        sequencer._add_tree_item(level=1, parameter='B', sequence='arange(2)')
+        sequencer._add_tree_item(level=0, parameter='B', sequence='[9]')
+
+        length, sequence = sequencer._generate_sequence_from_tree()
+        assert length == 5
+        assert list(sequence) == [
+            ({'a': 1}, {'b': 0}), ({'a': 1}, {'b': 1}),
+            ({'a': 2}, {'b': 0}), ({'a': 2}, {'b': 1}),
+            ({'b': 9},),
+        ]
+
+    def test_scalar_sequence_is_skipped(self, sequencer):
+        sequencer._add_tree_item(level=0, parameter='A', sequence='5')
+        sequencer._add_tree_item(level=0, parameter='B', sequence='[9]')
+
+        length, sequence = sequencer._generate_sequence_from_tree()
+        assert length == 1
+        assert list(sequence) == [({'b': 9},)]
@@ -24,11 +24,16 @@
 
 import pytest
 import os
+import pickle
 import tempfile
 from time import sleep
 from importlib.machinery import SourceFileLoader
 
-from pymeasure.experiment.workers import Worker
+from queue import Full
+from threading import Thread
+
+from pymeasure.experiment.workers import Worker, WorkerQueue, zmq
+from pymeasure.experiment.procedure import Procedure
 from pymeasure.experiment.results import Results
 
 # Load the procedure, without it being in a module
@@ -69,3 +74,165 @@ def test_worker_finish():
 
     new_results = Results.load(file, procedure_class=RandomProcedure)
     assert new_results.data.shape == (100, 2)
+
+
+def test_worker_queue_block():
+    queue = WorkerQueue(2, policy='block')
+    queue.put(('status', 1))
+    queue.put(('progress', 10.))
+    with pytest.raises(Full):
+        queue.put(('progress', 20.), block=False)
+    assert queue.statistics()['blocked'] == 1
+    assert queue.qsize() == 2
+
+
+def test_worker_queue_drop():
+    queue = WorkerQueue(2, policy='drop')
+    queue.put(('progress', 10.))
+    queue.put(('status', 1))
+    queue.put(('progress', 20.))
+    queue.put(('status', 2))
+    assert [queue.get() for i in range(2)] == [('status', 1), ('status', 2)]
+    assert queue.statistics()['dropped'] == 2
+
+
+def test_worker_queue_coalesce():
+    queue = WorkerQueue(policy='coalesce')
+    for progress in range(10):
+        queue.put(('progress', progress))
+    queue.put(('status', 1))
+    queue.put(('progress', 100))
+    queue.put(None)
+    assert [queue.get() for i in range(4)] == [
+        ('progress', 9), ('status', 1), ('progress', 100), None]
+    assert queue.statistics()['coalesced'] == 9
+
+
+def test_worker_queue_drop_keeps_task_accounting():
+    queue = WorkerQueue(1, policy='drop')
+    queue.put(('progress', 10.))
+    queue.put(('progress', 20.))
+    assert queue.get() == ('progress', 20.)
+    queue.task_done()
+    queue.join()  # returns only if dropped messages are accounted for
+    assert queue.unfinished_tasks == 0
+
+
+def test_worker_queue_never_blocks_on_control_messages():
+    queue = WorkerQueue(1, policy='block')
+    queue.put(('status', 1))
+    queue.put(('status', 2), block=False)
+    queue.put(None, block=False)
+    assert queue.qsize() == 3
+    assert queue.statistics()['overflow'] == 2
+
+
+def test_worker_bounded_queues_without_consumer():
+    procedure = RandomProcedure()
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results, recorder_queue_size=5, monitor_queue_size=1)
+    worker.daemon = True
+    worker.start()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    statistics = worker.queue_statistics()
+    assert statistics['recorder']['put'] == 101  # includes stop sentinel
+    assert statistics['monitor']['max_qsize'] <= 4
+
+    new_results = Results.load(file, procedure_class=RandomProcedure)
+    assert new_results.data.shape == (100, 2)
+
+
+def test_worker_bounded_queues_with_consumer():
+    procedure = RandomProcedure()
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results, monitor_queue_size=2, monitor_policy='coalesce')
+    worker.daemon = True
+    messages = []
+
+    def consume():
+        while True:
+            message = worker.monitor_queue.get()
+            if message is None:
+                break
+            messages.append(message)
+
+    consumer = Thread(target=consume, daemon=True)
+    consumer.start()
+    worker.start()
+    worker.join(timeout=5)
+    consumer.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert not consumer.is_alive()
+    statuses = [record for topic, record in messages if topic == 'status']
+    assert statuses == [Procedure.RUNNING, Procedure.FINISHED]
+
+
+def test_worker_coalesces_progress():
+    procedure = RandomProcedure()
+    procedure.iterations = 1000
+    procedure.delay = 0
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results, progress_interval=10)
+    worker.daemon = True
+    worker.start()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    messages = []
+    while not worker.monitor_queue.empty():
+        messages.append(worker.monitor_queue.get())
+    assert messages == [
+        ('status', Procedure.RUNNING), ('progress', 0.), ('progress', 99.9),
+        ('status', Procedure.FINISHED), ('progress', 100.), None]
+
+
+def test_worker_without_progress_interval():
+    procedure = RandomProcedure()
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results, progress_interval=0)
+    worker.daemon = True
+    worker.start()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert worker.queue_statistics()['monitor']['put'] == 105
+
+
+@pytest.mark.skipif(zmq is None, reason="ZMQ is required for TCP communication")
+def test_worker_publishes_to_subscribers():
+    context = zmq.Context()
+    subscriber = context.socket(zmq.SUB)
+    subscriber.connect('tcp://localhost:5899')
+    subscriber.setsockopt(zmq.SUBSCRIBE, b'results')
+
+    procedure = RandomProcedure()
+    procedure.delay = 0.005
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results, port=5899)
+    worker.daemon = True
+
+    received = []
+    poller = zmq.Poller()
+    poller.register(subscriber, zmq.POLLIN)
+    worker.start()
+    while poller.poll(2000):
+        topic, record = subscriber.recv_multipart()
+        assert topic == b'results'
+        received.append(pickle.loads(record))
+        if received[-1]['Iteration'] == 99:
+            break
+    worker.join(timeout=5)
+    subscriber.close()
+    context.term()
+
+    assert not worker.is_alive()
+    assert len(received) > 0
+    assert set(received[-1].keys()) == {'Iteration', 'Random Number'}